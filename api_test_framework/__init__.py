@@ -1,4 +1,10 @@
-from api_test_framework.config_loader import EndpointSpec, TestSpec, load_test_spec
+from api_test_framework.config_loader import (
+    EndpointSpec,
+    TestSpec,
+    load_test_spec,
+    load_test_spec_header,
+    load_test_spec_text,
+)
 from api_test_framework.fuzz_tester import FuzzCaseResult, FuzzTester
 from api_test_framework.invariant_checker import InvariantChecker, InvariantResult
 from api_test_framework.reporter import Reporter
@@ -22,4 +28,6 @@ __all__ = [
     "TestGenerator",
     "TestSpec",
     "load_test_spec",
+    "load_test_spec_header",
+    "load_test_spec_text",
 ]
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import copy
+import functools
+from contextlib import closing
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import yaml
 
 
 _ALLOWED_METHODS = {"GET", "POST", "PUT", "DELETE"}
 
+# Prefer the libyaml-backed loader; pure-Python SafeLoader is the fallback.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class EndpointSpec:
     name: str
     method: str
@@ -18,9 +24,11 @@ class EndpointSpec:
     body: Dict[str, Any] = field(default_factory=dict)
     expect_status: int = 200
     valid_cases: List[Dict[str, Any]] = field(default_factory=list)
+    # Fully-qualified URL (spec base_url + path), filled in by load_test_spec.
+    url: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestSpec:
     base_url: str
     endpoints: Dict[str, EndpointSpec]
@@ -37,6 +45,10 @@ class TestSpec:
     fuzz_endpoint: str = "transfer"
     stateful_sequence: List[Dict[str, Any]] = field(default_factory=list)
 
+    @staticmethod
+    def peek(path: str | Path) -> Dict[str, Any]:
+        return load_test_spec_header(path)
+
 
 class SpecValidationError(ValueError):
     pass
@@ -47,7 +59,98 @@ def load_test_spec(path: str | Path) -> TestSpec:
     if not spec_path.exists():
         raise SpecValidationError(f"Spec file not found: {spec_path}")
 
-    raw = yaml.safe_load(spec_path.read_text(encoding="utf-8"))
+    stat = spec_path.stat()
+    spec = _load_test_spec_cached(str(spec_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    # Hand out a private copy so callers can't mutate the cached instance.
+    return copy.deepcopy(spec)
+
+
+def load_test_spec_text(text: str | bytes) -> TestSpec:
+    # Same validation as load_test_spec, for YAML already in memory. Not cached.
+    return _build_spec(yaml.load(text, Loader=_YAML_LOADER))
+
+
+def load_test_spec_header(path: str | Path) -> Dict[str, Any]:
+    # Reads only `base_url` and the endpoint names. Parsing stops once both keys
+    # have been seen, so the rest of the document is never parsed or validated.
+    spec_path = Path(path)
+    if not spec_path.exists():
+        raise SpecValidationError(f"Spec file not found: {spec_path}")
+
+    header: Dict[str, Any] = {"base_url": None, "endpoints": []}
+    pending = {"base_url", "endpoints"}
+
+    with spec_path.open("rb") as stream, closing(yaml.parse(stream, Loader=_YAML_LOADER)) as events:
+        for event in events:
+            if isinstance(event, yaml.MappingStartEvent):
+                break
+            if isinstance(event, yaml.NodeEvent):
+                raise SpecValidationError("Spec root must be a YAML mapping")
+        else:
+            raise SpecValidationError("Spec root must be a YAML mapping")
+
+        for key_event in events:
+            if not pending or isinstance(key_event, yaml.MappingEndEvent):
+                break
+            if isinstance(key_event, yaml.ScalarEvent):
+                key = key_event.value
+            else:
+                key = None
+                _skip_yaml_node(key_event, events)
+
+            value_event = next(events)
+            if key == "base_url" and isinstance(value_event, yaml.ScalarEvent):
+                header["base_url"] = value_event.value
+            elif key == "endpoints" and isinstance(value_event, yaml.MappingStartEvent):
+                header["endpoints"] = _read_mapping_keys(events)
+            else:
+                _skip_yaml_node(value_event, events)
+            pending.discard(key)
+
+    base_url = header["base_url"]
+    if not isinstance(base_url, str) or not base_url.strip():
+        raise SpecValidationError("`base_url` is required and must be a non-empty string")
+    if not header["endpoints"]:
+        raise SpecValidationError("`endpoints` is required and must be a non-empty mapping")
+
+    header["base_url"] = base_url.rstrip("/")
+    return header
+
+
+def _read_mapping_keys(events: Iterator[yaml.Event]) -> List[str]:
+    # Consumes a mapping whose MappingStartEvent was already read, keeping scalar keys only.
+    keys: List[str] = []
+    for key_event in events:
+        if isinstance(key_event, yaml.MappingEndEvent):
+            break
+        if isinstance(key_event, yaml.ScalarEvent):
+            keys.append(key_event.value)
+        else:
+            _skip_yaml_node(key_event, events)
+        _skip_yaml_node(next(events), events)
+    return keys
+
+
+def _skip_yaml_node(first_event: yaml.Event, events: Iterator[yaml.Event]) -> None:
+    if not isinstance(first_event, yaml.CollectionStartEvent):
+        return
+    depth = 1
+    for event in events:
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+@functools.lru_cache(maxsize=32)
+def _load_test_spec_cached(path: str, _mtime_ns: int, _size: int) -> TestSpec:
+    # mtime/size are part of the cache key so edits to the file invalidate it.
+    return _build_spec(yaml.load(Path(path).read_bytes(), Loader=_YAML_LOADER))
+
+
+def _build_spec(raw: Any) -> TestSpec:
     if not isinstance(raw, dict):
         raise SpecValidationError("Spec root must be a YAML mapping")
 
@@ -55,13 +158,15 @@ def load_test_spec(path: str | Path) -> TestSpec:
     if not isinstance(base_url, str) or not base_url.strip():
         raise SpecValidationError("`base_url` is required and must be a non-empty string")
 
+    base_url = base_url.rstrip("/")
+
     endpoints_raw = raw.get("endpoints")
     if not isinstance(endpoints_raw, dict) or not endpoints_raw:
         raise SpecValidationError("`endpoints` is required and must be a non-empty mapping")
 
     endpoints: Dict[str, EndpointSpec] = {}
     for name, conf in endpoints_raw.items():
-        endpoints[name] = _parse_endpoint(name, conf)
+        endpoints[name] = _parse_endpoint(name, conf, base_url)
 
     invariants = raw.get("invariants", ["balance_non_negative", "money_conserved", "idempotent"])
     if not isinstance(invariants, list) or not all(isinstance(i, str) for i in invariants):
@@ -80,7 +185,7 @@ def load_test_spec(path: str | Path) -> TestSpec:
             )
 
     return TestSpec(
-        base_url=base_url.rstrip("/"),
+        base_url=base_url,
         endpoints=endpoints,
         timeout_seconds=float(raw.get("timeout_seconds", 5.0)),
         response_sla_ms=int(raw.get("response_sla_ms", 200)),
@@ -95,7 +200,7 @@ def load_test_spec(path: str | Path) -> TestSpec:
     )
 
 
-def _parse_endpoint(name: str, conf: Any) -> EndpointSpec:
+def _parse_endpoint(name: str, conf: Any, base_url: str) -> EndpointSpec:
     if not isinstance(conf, dict):
         raise SpecValidationError(f"Endpoint `{name}` must be a mapping")
 
@@ -135,4 +240,5 @@ def _parse_endpoint(name: str, conf: Any) -> EndpointSpec:
         body=body,
         expect_status=expect_status,
         valid_cases=valid_cases,
+        url=f"{base_url}{path}",
     )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
@@ -9,7 +10,24 @@ from api_test_framework.request_engine import RequestEngine, RequestResult
 from api_test_framework.state_tracker import StateTracker
 
 
-@dataclass
+def _without(payload: Dict[str, Any], key: str) -> Dict[str, Any]:
+    return {k: v for k, v in payload.items() if k != key}
+
+
+# (case name, mutator) pairs; each mutator builds a new payload from (base, amount).
+_FUZZ_MUTATIONS: List[tuple[str, Callable[[Dict[str, Any], float], Dict[str, Any]]]] = [
+    ("negative_amount", lambda base, amount: {**base, "amount": -abs(amount)}),
+    ("huge_amount", lambda base, _amount: {**base, "amount": 99999999999}),
+    ("missing_from", lambda base, _amount: _without(base, "from")),
+    ("missing_amount", lambda base, _amount: _without(base, "amount")),
+    ("wrong_type_amount", lambda base, _amount: {**base, "amount": "abc"}),
+    ("wrong_type_from", lambda base, _amount: {**base, "from": 12345}),
+    ("boundary_zero", lambda base, _amount: {**base, "amount": 0}),
+    ("boundary_fraction", lambda base, _amount: {**base, "amount": 0.001}),
+]
+
+
+@dataclass(slots=True)
 class FuzzCaseResult:
     case_name: str
     payload: Dict[str, Any]
@@ -25,102 +43,142 @@ class FuzzTester:
         request_engine: RequestEngine,
         state_tracker: StateTracker,
         invariant_checker: InvariantChecker,
+        *,
+        parallel: bool = False,
+        max_workers: int = 8,
     ) -> None:
         self.request_engine = request_engine
         self.state_tracker = state_tracker
         self.invariant_checker = invariant_checker
+        # Only used when no before_case_hook is given; hooks force serial execution.
+        self.parallel = parallel
+        self.max_workers = max_workers
 
     def generate_cases(self, seed_payload: Dict[str, Any]) -> List[tuple[str, Dict[str, Any]]]:
         base = dict(seed_payload)
         amount = float(base.get("amount", 100))
-
-        cases: List[tuple[str, Dict[str, Any]]] = []
-
-        neg = dict(base)
-        neg["amount"] = -abs(amount)
-        cases.append(("negative_amount", neg))
-
-        huge = dict(base)
-        huge["amount"] = 99999999999
-        cases.append(("huge_amount", huge))
-
-        missing_from = dict(base)
-        missing_from.pop("from", None)
-        cases.append(("missing_from", missing_from))
-
-        missing_amount = dict(base)
-        missing_amount.pop("amount", None)
-        cases.append(("missing_amount", missing_amount))
-
-        wrong_type_amount = dict(base)
-        wrong_type_amount["amount"] = "abc"
-        cases.append(("wrong_type_amount", wrong_type_amount))
-
-        wrong_type_from = dict(base)
-        wrong_type_from["from"] = 12345
-        cases.append(("wrong_type_from", wrong_type_from))
-
-        boundary_zero = dict(base)
-        boundary_zero["amount"] = 0
-        cases.append(("boundary_zero", boundary_zero))
-
-        boundary_fraction = dict(base)
-        boundary_fraction["amount"] = 0.001
-        cases.append(("boundary_fraction", boundary_fraction))
-
-        return cases
+        return [(name, mutate(base, amount)) for name, mutate in _FUZZ_MUTATIONS]
 
     def run(
         self,
         endpoint: EndpointSpec,
         seed_payload: Dict[str, Any],
-        before_case_hook: Optional[Callable[[], None]] = None,
+        before_case_hook: Optional[Callable[[], Optional[bool]]] = None,
+        after_case_hook: Optional[Callable[[FuzzCaseResult], None]] = None,
     ) -> List[FuzzCaseResult]:
-        results: List[FuzzCaseResult] = []
+        cases = self.generate_cases(seed_payload)
+        if self.parallel and before_case_hook is None:
+            results = self._run_parallel(endpoint, cases)
+            if after_case_hook is not None:
+                for result in results:
+                    after_case_hook(result)
+            return results
 
-        for case_name, payload in self.generate_cases(seed_payload):
-            if before_case_hook is not None:
-                before_case_hook()
+        results: List[FuzzCaseResult] = []
+        state_before: Optional[Dict[str, float]] = None
+        before_non_negative: Optional[bool] = None
+
+        for case_name, payload in cases:
+            # The hook may have changed server state, making the last snapshot stale,
+            # unless it returns False to say it left the server untouched.
+            if before_case_hook is not None and before_case_hook() is not False:
+                state_before = None
+
+            if state_before is None:
+                state_before = self.state_tracker.capture_state()
+                before_non_negative = None
+            result, state_after, non_negative = self._run_case(
+                endpoint, case_name, payload, state_before, before_non_negative
+            )
+            results.append(result)
+            if after_case_hook is not None:
+                after_case_hook(result)
+            # Nothing ran since the last capture, so it doubles as the next "before".
+            state_before = state_after
+            before_non_negative = non_negative
 
-            state_before = self.state_tracker.capture_state()
-            req_result = self.request_engine.send_endpoint(endpoint, payload)
-            state_after = self.state_tracker.capture_state()
+        return results
 
-            state_changed = state_before != state_after
+    def _run_parallel(
+        self,
+        endpoint: EndpointSpec,
+        cases: List[tuple[str, Dict[str, Any]]],
+    ) -> List[FuzzCaseResult]:
+        # Cases overlap, so each one is compared against a single pre-run baseline:
+        # `state_changed` means "state differs from the baseline", not "this case changed it".
+        # Another case may have been accepted meanwhile, so it cannot fail a rejected case.
+        baseline = self.state_tracker.capture_state()
+        baseline_non_negative = self.invariant_checker.check_balance_non_negative(baseline).passed
+
+        def _execute(case: tuple[str, Dict[str, Any]]) -> FuzzCaseResult:
+            case_name, payload = case
+            return self._run_case(
+                endpoint,
+                case_name,
+                payload,
+                baseline,
+                baseline_non_negative,
+                attribute_state_change=False,
+            )[0]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(_execute, cases))
+
+    def _run_case(
+        self,
+        endpoint: EndpointSpec,
+        case_name: str,
+        payload: Dict[str, Any],
+        state_before: Dict[str, float],
+        before_non_negative: Optional[bool] = None,
+        *,
+        attribute_state_change: bool = True,
+    ) -> tuple[FuzzCaseResult, Dict[str, float], bool]:
+        req_result = self.request_engine.send_endpoint(endpoint, payload)
+        state_after = self.state_tracker.capture_state()
+
+        state_changed = state_before != state_after
+        if state_changed or before_non_negative is None:
             non_negative = self.invariant_checker.check_balance_non_negative(state_after).passed
-
-            server_error = req_result.error is not None or req_result.status_code >= 500
-            rejected = 400 <= req_result.status_code < 500
-
-            if server_error:
-                passed = False
-                message = (
-                    f"Server error for case `{case_name}` "
-                    f"(status={req_result.status_code}, error={req_result.error})"
-                )
-            elif rejected:
-                passed = (not state_changed) and non_negative
-                message = (
-                    f"Rejected invalid input with status {req_result.status_code}; "
-                    f"state_changed={state_changed}"
-                )
-            else:
-                # Graceful handling is accepted if invariants still hold.
-                passed = non_negative
-                message = (
-                    f"Handled input without server error (status={req_result.status_code}); "
-                    f"state_changed={state_changed}"
-                )
-
-            results.append(
-                FuzzCaseResult(
-                    case_name=case_name,
-                    payload=payload,
-                    request_result=req_result,
-                    state_changed=state_changed,
-                    passed=passed,
-                    message=message,
-                )
+        else:
+            # Same balances as before the case, so the earlier verdict still applies.
+            non_negative = before_non_negative
+
+        server_error = req_result.error is not None or req_result.status_code >= 500
+        rejected = 400 <= req_result.status_code < 500
+
+        if server_error:
+            passed = False
+            message = (
+                f"Server error for case `{case_name}` "
+                f"(status={req_result.status_code}, error={req_result.error})"
+            )
+        elif rejected and not attribute_state_change:
+            passed = non_negative
+            message = (
+                f"Rejected invalid input with status {req_result.status_code}; "
+                "state change not attributable in parallel mode"
+            )
+        elif rejected:
+            passed = (not state_changed) and non_negative
+            message = (
+                f"Rejected invalid input with status {req_result.status_code}; "
+                f"state_changed={state_changed}"
+            )
+        else:
+            # Graceful handling is accepted if invariants still hold.
+            passed = non_negative
+            message = (
+                f"Handled input without server error (status={req_result.status_code}); "
+                f"state_changed={state_changed}"
             )
 
-        return results
+        result = FuzzCaseResult(
+            case_name=case_name,
+            payload=payload,
+            request_result=req_result,
+            state_changed=state_changed,
+            passed=passed,
+            message=message,
+        )
+        return result, state_after, non_negative
@@ -1,83 +1,152 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional accelerator
+    np = None
 
-@dataclass
+
+# Below this many accounts the array conversion costs more than it saves.
+_VECTORIZE_MIN_ACCOUNTS = 256
+
+
+def _balances_array(state: Dict[str, float]) -> Optional[np.ndarray]:
+    if np is None or len(state) < _VECTORIZE_MIN_ACCOUNTS:
+        return None
+    return np.fromiter(state.values(), dtype=np.float64, count=len(state))
+
+
+def _total_balance(balances: Iterable[float]) -> float:
+    # Always fsum: a pairwise/naive sum over many accounts drifts past the tolerance
+    # and would report money that was never created or lost.
+    return math.fsum(balances)
+
+
+@dataclass(slots=True, frozen=True)
 class InvariantResult:
     name: str
     passed: bool
     message: str
 
 
-class InvariantChecker:
-    def check_balance_non_negative(self, state_after: Dict[str, float]) -> InvariantResult:
-        negatives = {account: balance for account, balance in state_after.items() if balance < 0}
-        if negatives:
-            details = ", ".join(f"{acct}={bal:.2f}" for acct, bal in sorted(negatives.items()))
-            return InvariantResult(
-                name="balance_non_negative",
-                passed=False,
-                message=f"Negative balances detected: {details}",
-            )
+# Pass results carry no per-call data, so every passing check shares one instance.
+_PASS_NON_NEGATIVE = InvariantResult(
+    name="balance_non_negative",
+    passed=True,
+    message="All account balances are non-negative",
+)
+_PASS_IDEMPOTENT = InvariantResult(
+    name="idempotent",
+    passed=True,
+    message="Replayed request produced identical final state",
+)
+
+
+def _non_negative_result(negatives: List[Tuple[str, float]]) -> InvariantResult:
+    if not negatives:
+        return _PASS_NON_NEGATIVE
+    details = ", ".join(f"{acct}={bal:.2f}" for acct, bal in sorted(negatives))
+    return InvariantResult(
+        name="balance_non_negative",
+        passed=False,
+        message=f"Negative balances detected: {details}",
+    )
+
+
+def _money_conserved_result(
+    total_before: float, total_after: float, tolerance: float
+) -> InvariantResult:
+    delta = total_after - total_before
+    passed = abs(delta) <= tolerance
+
+    if passed:
         return InvariantResult(
-            name="balance_non_negative",
+            name="money_conserved",
             passed=True,
-            message="All account balances are non-negative",
+            message=(
+                f"Total money conserved (before={total_before:.2f}, after={total_after:.2f})"
+            ),
         )
 
+    return InvariantResult(
+        name="money_conserved",
+        passed=False,
+        message=(
+            f"Money drift detected (before={total_before:.2f}, "
+            f"after={total_after:.2f}, delta={delta:.2f})"
+        ),
+    )
+
+
+class InvariantChecker:
+    @staticmethod
+    def check_balance_non_negative(state_after: Dict[str, float]) -> InvariantResult:
+        balances = _balances_array(state_after)
+        if balances is None:
+            return _non_negative_result(
+                [(account, balance) for account, balance in state_after.items() if balance < 0]
+            )
+        negative = np.flatnonzero(balances < 0)
+        if not negative.size:
+            return _PASS_NON_NEGATIVE
+        # Names are only needed to label offenders, so they're built on failure alone.
+        names = list(state_after)
+        return _non_negative_result([(names[i], float(balances[i])) for i in negative])
+
+    @staticmethod
     def check_money_conserved(
-        self,
         state_before: Dict[str, float],
         state_after: Dict[str, float],
         tolerance: float = 1e-9,
     ) -> InvariantResult:
-        total_before = sum(state_before.values())
-        total_after = sum(state_after.values())
-        delta = total_after - total_before
-        passed = abs(delta) <= tolerance
-
-        if passed:
-            return InvariantResult(
-                name="money_conserved",
-                passed=True,
-                message=(
-                    f"Total money conserved (before={total_before:.2f}, after={total_after:.2f})"
-                ),
-            )
-
-        return InvariantResult(
-            name="money_conserved",
-            passed=False,
-            message=(
-                f"Money drift detected (before={total_before:.2f}, "
-                f"after={total_after:.2f}, delta={delta:.2f})"
-            ),
+        return _money_conserved_result(
+            _total_balance(state_before.values()), _total_balance(state_after.values()), tolerance
         )
 
+    @staticmethod
+    def check_money_conserved_total(
+        total_before: float,
+        state_after: Dict[str, float],
+        tolerance: float = 1e-9,
+        *,
+        total_after: Optional[float] = None,
+    ) -> InvariantResult:
+        # For callers that already hold the before-total, e.g. one carried over from
+        # the previous case. `total_after` may be passed too when the caller sums
+        # `state_after` itself to carry it forward; otherwise it is summed here.
+        if total_after is None:
+            total_after = _total_balance(state_after.values())
+        return _money_conserved_result(total_before, total_after, tolerance)
+
+    @staticmethod
     def check_idempotent(
-        self,
         state_after_first: Dict[str, float],
         state_after_retries: Dict[str, float],
         tolerance: float = 1e-9,
     ) -> InvariantResult:
-        changed: List[str] = []
-        all_accounts = sorted(set(state_after_first) | set(state_after_retries))
-        for account in all_accounts:
-            first = state_after_first.get(account, 0.0)
+        changed: List[Tuple[str, float, float]] = []
+        for account, first in state_after_first.items():
             retry = state_after_retries.get(account, 0.0)
             if abs(first - retry) > tolerance:
-                changed.append(f"{account}: {first:.2f} -> {retry:.2f}")
+                changed.append((account, first, retry))
+        # Accounts that only appear after the retries.
+        for account in state_after_retries.keys() - state_after_first.keys():
+            retry = state_after_retries[account]
+            if abs(retry) > tolerance:
+                changed.append((account, 0.0, retry))
 
         if changed:
+            # Sorting is deferred to the (rare) failure path.
+            details = "; ".join(
+                f"{account}: {first:.2f} -> {retry:.2f}" for account, first, retry in sorted(changed)
+            )
             return InvariantResult(
                 name="idempotent",
                 passed=False,
-                message="State changed across retries: " + "; ".join(changed),
+                message="State changed across retries: " + details,
             )
-        return InvariantResult(
-            name="idempotent",
-            passed=True,
-            message="Replayed request produced identical final state",
-        )
+        return _PASS_IDEMPOTENT
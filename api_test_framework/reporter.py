@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import io
+import json
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     from colorama import Fore, Style, init
@@ -18,12 +20,17 @@ except ImportError:  # pragma: no cover - fallback for minimal environments
     def init(*_args, **_kwargs) -> None:
         return None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback for minimal environments
+    orjson = None
+
 from api_test_framework.fuzz_tester import FuzzCaseResult
 from api_test_framework.invariant_checker import InvariantResult
 from api_test_framework.request_engine import RequestResult
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportEntry:
     phase: str
     name: str
@@ -36,6 +43,8 @@ class Reporter:
         init(autoreset=True)
         self.use_color = use_color
         self.entries: List[ReportEntry] = []
+        self._passed = 0
+        self._failed = 0
 
     def add_request(self, phase: str, result: RequestResult, sla_ms: Optional[int] = None) -> None:
         no_error = result.error is None
@@ -50,7 +59,7 @@ class Reporter:
         if sla_ms is not None:
             message += f", SLA<{sla_ms}ms"
 
-        self.entries.append(
+        self._record(
             ReportEntry(
                 phase=phase,
                 name=f"Request {result.method} {result.path}",
@@ -60,7 +69,7 @@ class Reporter:
         )
 
     def add_invariant(self, phase: str, invariant: InvariantResult) -> None:
-        self.entries.append(
+        self._record(
             ReportEntry(
                 phase=phase,
                 name=f"Invariant {invariant.name}",
@@ -70,7 +79,7 @@ class Reporter:
         )
 
     def add_fuzz_case(self, phase: str, fuzz_result: FuzzCaseResult) -> None:
-        self.entries.append(
+        self._record(
             ReportEntry(
                 phase=phase,
                 name=f"Fuzz {fuzz_result.case_name}",
@@ -80,27 +89,46 @@ class Reporter:
         )
 
     def add_custom(self, phase: str, name: str, passed: bool, message: str) -> None:
-        self.entries.append(ReportEntry(phase=phase, name=name, passed=passed, message=message))
+        self._record(ReportEntry(phase=phase, name=name, passed=passed, message=message))
+
+    def _record(self, entry: ReportEntry) -> None:
+        self.entries.append(entry)
+        if entry.passed:
+            self._passed += 1
+        else:
+            self._failed += 1
 
     @property
     def has_failures(self) -> bool:
-        return any(not entry.passed for entry in self.entries)
+        return self._failed > 0
 
     def render(self) -> str:
-        lines = ["========== TEST REPORT =========="]
+        pass_marker = "[PASS]"
+        fail_marker = "[FAIL]"
+        if self.use_color:
+            pass_marker = f"{Fore.GREEN}{pass_marker}{Style.RESET_ALL}"
+            fail_marker = f"{Fore.RED}{fail_marker}{Style.RESET_ALL}"
+
+        buf = io.StringIO()
+        write = buf.write
+        write("========== TEST REPORT ==========\n")
 
         for entry in self.entries:
-            marker = "[PASS]" if entry.passed else "[FAIL]"
-            if self.use_color:
-                color = Fore.GREEN if entry.passed else Fore.RED
-                marker = f"{color}{marker}{Style.RESET_ALL}"
-            lines.append(f"{marker} {entry.phase}: {entry.name} - {entry.message}")
-
-        passed_count = sum(1 for entry in self.entries if entry.passed)
-        failed_count = len(self.entries) - passed_count
-        lines.append("==================================")
-        lines.append(f"Summary: passed={passed_count}, failed={failed_count}, total={len(self.entries)}")
-        return "\n".join(lines)
+            write(pass_marker if entry.passed else fail_marker)
+            write(" ")
+            write(entry.phase)
+            write(": ")
+            write(entry.name)
+            write(" - ")
+            write(entry.message)
+            write("\n")
+
+        write("==================================\n")
+        write(
+            f"Summary: passed={self._passed}, failed={self._failed}, "
+            f"total={self._passed + self._failed}"
+        )
+        return buf.getvalue()
 
     def print(self) -> None:
         print(self.render())
@@ -108,3 +136,24 @@ class Reporter:
     def write(self, path: str | Path) -> None:
         output_path = Path(path)
         output_path.write_text(self.render(), encoding="utf-8")
+
+    def write_json(self, path: str | Path) -> None:
+        output_path = Path(path)
+        output_path.write_bytes(_dump_json(self._json_document()))
+
+    def _json_document(self) -> Dict[str, Any]:
+        return {
+            "summary": {
+                "passed": self._passed,
+                "failed": self._failed,
+                "total": self._passed + self._failed,
+            },
+            # orjson serializes dataclasses natively; only the stdlib path needs asdict().
+            "entries": self.entries if orjson is not None else [asdict(e) for e in self.entries],
+        }
+
+
+def _dump_json(document: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(document, option=orjson.OPT_INDENT_2)
+    return json.dumps(document, indent=2, ensure_ascii=False).encode("utf-8")
@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.compat import json as _requests_json
+from requests.structures import CaseInsensitiveDict
 
 from api_test_framework.config_loader import EndpointSpec
 
+try:
+    import orjson
 
-@dataclass
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - fallback for minimal environments
+    import json
+
+    _json_loads = json.loads
+
+_JSON_CONTENT_TYPE = "application/json"
+_JSON_BODY_HEADERS = {"Content-Type": _JSON_CONTENT_TYPE}
+_POOL_MAXSIZE = 64
+
+
+@dataclass(slots=True)
 class RequestResult:
     endpoint_name: str
     method: str
@@ -22,10 +39,47 @@ class RequestResult:
 
 
 class RequestEngine:
-    def __init__(self, base_url: str, timeout_seconds: float = 5.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: float = 5.0,
+        *,
+        adapter: Optional[BaseAdapter] = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
 
+        # One pooled session keeps connections alive across the whole run. A custom
+        # transport `adapter` replaces the pooled HTTP one, e.g. to run without a server.
+        self._session = requests.Session()
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=_POOL_MAXSIZE, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {"Connection": "keep-alive", "Accept": "application/json"}
+        )
+
+    def close(self) -> None:
+        self._session.close()
+
+    @staticmethod
+    def encode_body(
+        endpoint: EndpointSpec, payload: Optional[Dict[str, Any]] = None
+    ) -> Optional[bytes]:
+        # Pre-serializes a body that is sent many times unchanged; pass the result
+        # back as `body_bytes=`. Encodes exactly as requests does for `json=`, so the
+        # bytes on the wire don't depend on which path sent them. Returns None for
+        # GET endpoints, and for bodies requests can't encode, so that sending falls
+        # back to `json=` and surfaces the error the way an unencoded send would.
+        json_body = _endpoint_body(endpoint, payload)
+        if json_body is None:
+            return None
+        try:
+            return _requests_json.dumps(json_body, allow_nan=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return None
+
     def request(
         self,
         method: str,
@@ -33,26 +87,137 @@ class RequestEngine:
         *,
         endpoint_name: str = "",
         json_body: Optional[Dict[str, Any]] = None,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> RequestResult:
+        return self._send(
+            method.upper(),
+            f"{self.base_url}{path}",
+            path,
+            endpoint_name=endpoint_name,
+            json_body=json_body,
+            headers=headers,
+            params=params,
+        )
+
+    def send_endpoint(
+        self,
+        endpoint: EndpointSpec,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        body_bytes: Optional[bytes] = None,
+    ) -> RequestResult:
+        return self._send_endpoint(
+            endpoint, f"{self.base_url}{endpoint.path}", payload, headers, params, body_bytes
+        )
+
+    def send_endpoint_many(
+        self,
+        endpoint: EndpointSpec,
+        payloads: Sequence[Optional[Dict[str, Any]]],
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        body_bytes: Optional[bytes] = None,
+        parallel: bool = True,
+    ) -> List[RequestResult]:
+        # Sends one request per payload, concurrently over the pooled session unless
+        # `parallel` is False. Results come back in payload order. A payload object
+        # repeated in `payloads` is only serialized once; `body_bytes`, when given,
+        # is sent for every payload instead.
+        if body_bytes is not None:
+            encoded = dict.fromkeys(map(id, payloads), body_bytes)
+        else:
+            encoded = {id(payload): self.encode_body(endpoint, payload) for payload in payloads}
+
+        def _send_one(payload: Optional[Dict[str, Any]]) -> RequestResult:
+            return self.send_endpoint(
+                endpoint, payload, headers=headers, body_bytes=encoded[id(payload)]
+            )
+
+        if not parallel or len(payloads) < 2:
+            return list(map(_send_one, payloads))
+        # No more threads than pooled connections; extra ones would only queue on the pool.
+        with ThreadPoolExecutor(max_workers=min(len(payloads), _POOL_MAXSIZE)) as executor:
+            return list(executor.map(_send_one, payloads))
+
+    def send_prebuilt_endpoint(
+        self,
+        endpoint: EndpointSpec,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
+        body_bytes: Optional[bytes] = None,
     ) -> RequestResult:
-        url = f"{self.base_url}{path}"
-        started = time.perf_counter()
+        # Uses the URL precomputed at spec-load time; only valid when the engine
+        # targets the same base URL as the spec the endpoint came from.
+        return self._send_endpoint(
+            endpoint,
+            endpoint.url or f"{self.base_url}{endpoint.path}",
+            payload,
+            headers,
+            params,
+            body_bytes,
+        )
+
+    def _send_endpoint(
+        self,
+        endpoint: EndpointSpec,
+        url: str,
+        payload: Optional[Dict[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        params: Optional[Dict[str, Any]],
+        body_bytes: Optional[bytes],
+    ) -> RequestResult:
+        return self._send(
+            endpoint.method,
+            url,
+            endpoint.path,
+            endpoint_name=endpoint.name,
+            json_body=None if body_bytes is not None else _endpoint_body(endpoint, payload),
+            headers=headers,
+            params=params,
+            body_bytes=body_bytes,
+        )
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        *,
+        endpoint_name: str,
+        json_body: Optional[Dict[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        params: Optional[Dict[str, Any]],
+        body_bytes: Optional[bytes] = None,
+    ) -> RequestResult:
+        # `method` must already be upper-case. `body_bytes`, when given, is an
+        # already-encoded JSON body and takes the place of `json_body`.
+        if body_bytes is not None:
+            if headers is None:
+                headers = _JSON_BODY_HEADERS
+            elif not _has_content_type(headers):
+                headers = {**_JSON_BODY_HEADERS, **headers}
+        started = time.perf_counter_ns()
 
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
+                data=body_bytes,
                 json=json_body,
                 params=params,
                 headers=headers,
                 timeout=self.timeout_seconds,
             )
-            latency_ms = (time.perf_counter() - started) * 1000
+            latency_ms = (time.perf_counter_ns() - started) / 1_000_000
             body = _decode_response_body(response)
             return RequestResult(
                 endpoint_name=endpoint_name,
-                method=method.upper(),
+                method=method,
                 url=url,
                 path=path,
                 status_code=response.status_code,
@@ -60,10 +225,10 @@ class RequestEngine:
                 latency_ms=latency_ms,
             )
         except requests.RequestException as exc:
-            latency_ms = (time.perf_counter() - started) * 1000
+            latency_ms = (time.perf_counter_ns() - started) / 1_000_000
             return RequestResult(
                 endpoint_name=endpoint_name,
-                method=method.upper(),
+                method=method,
                 url=url,
                 path=path,
                 status_code=0,
@@ -72,34 +237,27 @@ class RequestEngine:
                 error=str(exc),
             )
 
-    def send_endpoint(
-        self,
-        endpoint: EndpointSpec,
-        payload: Optional[Dict[str, Any]] = None,
-        *,
-        headers: Optional[Dict[str, str]] = None,
-        params: Optional[Dict[str, Any]] = None,
-    ) -> RequestResult:
-        request_body = payload if payload is not None else endpoint.body
-        if endpoint.method == "GET":
-            request_body = None
 
-        return self.request(
-            endpoint.method,
-            endpoint.path,
-            endpoint_name=endpoint.name,
-            json_body=request_body,
-            headers=headers,
-            params=params,
-        )
+def _has_content_type(headers: Mapping[str, str]) -> bool:
+    if isinstance(headers, CaseInsensitiveDict):
+        return "Content-Type" in headers
+    return any(name.lower() == "content-type" for name in headers)
+
 
+def _endpoint_body(
+    endpoint: EndpointSpec, payload: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    if endpoint.method == "GET":
+        return None
+    return payload if payload is not None else endpoint.body
 
 
 def _decode_response_body(response: requests.Response) -> Any:
     content_type = response.headers.get("Content-Type", "")
-    if "application/json" in content_type.lower():
+    if content_type[: len(_JSON_CONTENT_TYPE)].lower() == _JSON_CONTENT_TYPE:
         try:
-            return response.json()
+            # Parse the raw bytes directly; both parsers raise ValueError subclasses.
+            return _json_loads(response.content)
         except ValueError:
             return response.text
     return response.text
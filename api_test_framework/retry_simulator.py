@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from requests.structures import CaseInsensitiveDict
+
 from api_test_framework.config_loader import EndpointSpec
 from api_test_framework.invariant_checker import InvariantChecker, InvariantResult
 from api_test_framework.request_engine import RequestEngine, RequestResult
@@ -26,10 +28,14 @@ class RetrySimulator:
         request_engine: RequestEngine,
         state_tracker: StateTracker,
         invariant_checker: InvariantChecker,
+        *,
+        parallel: bool = True,
     ) -> None:
         self.request_engine = request_engine
         self.state_tracker = state_tracker
         self.invariant_checker = invariant_checker
+        # Replays after the first request are sent concurrently, like a client retry storm.
+        self.parallel = parallel
 
     def simulate(
         self,
@@ -43,24 +49,36 @@ class RetrySimulator:
         if retry_count < 2:
             retry_count = 2
 
-        merged_headers: Dict[str, str] = {}
-        if headers:
-            merged_headers.update(headers)
+        # Built once and shared by every attempt; case-insensitive so a caller-supplied
+        # `idempotency-key` is replaced rather than sent alongside ours.
+        merged_headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(headers or {})
         merged_headers["Idempotency-Key"] = idempotency_key
+        # Encoded once so every attempt, including the first, sends identical bytes.
+        body_bytes = self.request_engine.encode_body(endpoint, payload)
+        if body_bytes is not None:
+            # Declared here so the engine can send these headers as they are.
+            merged_headers.setdefault("Content-Type", "application/json")
 
         state_before = self.state_tracker.capture_state()
 
         request_results: List[RequestResult] = []
 
-        first_result = self.request_engine.send_endpoint(endpoint, payload, headers=merged_headers)
+        first_result = self.request_engine.send_endpoint(
+            endpoint, payload, headers=merged_headers, body_bytes=body_bytes
+        )
         request_results.append(first_result)
 
         state_after_first = self.state_tracker.capture_state()
 
-        for _ in range(retry_count - 1):
-            request_results.append(
-                self.request_engine.send_endpoint(endpoint, payload, headers=merged_headers)
+        request_results.extend(
+            self.request_engine.send_endpoint_many(
+                endpoint,
+                [payload] * (retry_count - 1),
+                headers=merged_headers,
+                body_bytes=body_bytes,
+                parallel=self.parallel,
             )
+        )
 
         state_after_retries = self.state_tracker.capture_state()
 
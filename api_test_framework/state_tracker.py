@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import Dict
 
 from api_test_framework.request_engine import RequestEngine
@@ -32,4 +33,4 @@ class StateTracker:
 
     @staticmethod
     def total_balance(state: Dict[str, float]) -> float:
-        return float(sum(state.values()))
+        return math.fsum(state.values())
@@ -22,20 +22,17 @@ class TestGenerator:
         # Generate a few deterministic edge values for amount-driven payloads.
         if "amount" in body:
             amount = float(body["amount"])
+            # Clones only differ in `amount`, so that is all dedup needs to look at.
+            seen_amounts = {body["amount"]}
             for candidate in [max(0.01, round(amount / 10, 3)), round(amount * 10, 3), 1.0]:
+                if candidate in seen_amounts:
+                    continue
+                seen_amounts.add(candidate)
                 clone = dict(body)
                 clone["amount"] = candidate
                 generated.append(clone)
 
-        deduped: List[Dict[str, Any]] = []
-        seen = set()
-        for payload in generated:
-            marker = tuple(sorted(payload.items()))
-            if marker not in seen:
-                deduped.append(payload)
-                seen.add(marker)
-
-        return deduped
+        return generated
 
     def generate_stateful_sequence(self, spec: TestSpec) -> List[Dict[str, Any]]:
         if spec.stateful_sequence:
@@ -1,19 +1,39 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
-
-from api_test_framework.config_loader import SpecValidationError, load_test_spec
-from api_test_framework.fuzz_tester import FuzzTester
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from api_test_framework.config_loader import (
+    EndpointSpec,
+    SpecValidationError,
+    load_test_spec,
+    load_test_spec_header,
+)
+from api_test_framework.fuzz_tester import FuzzCaseResult, FuzzTester
 from api_test_framework.invariant_checker import InvariantChecker
 from api_test_framework.reporter import Reporter
-from api_test_framework.request_engine import RequestEngine
+from api_test_framework.request_engine import RequestEngine, RequestResult
 from api_test_framework.retry_simulator import RetrySimulator
 from api_test_framework.state_tracker import StateTracker
 from api_test_framework.test_generator import TestGenerator
 
 
-def run(spec_path: str, report_file: str | None = None) -> int:
+# Endpoints that only manage or observe state; they are not exercised as normal cases.
+_NORMAL_SKIP_ENDPOINTS = frozenset(("reset", "balance"))
+
+# (result, total before, state after, total after) for one normal case.
+_NormalOutcome = Tuple[RequestResult, Optional[float], Optional[Dict[str, float]], Optional[float]]
+
+
+def run(
+    spec_path: str,
+    report_file: str | None = None,
+    report_json_file: str | None = None,
+    max_workers: int = 1,
+) -> int:
     try:
         spec = load_test_spec(spec_path)
     except SpecValidationError as exc:
@@ -21,6 +41,19 @@ def run(spec_path: str, report_file: str | None = None) -> int:
         return 2
 
     request_engine = RequestEngine(spec.base_url, timeout_seconds=spec.timeout_seconds)
+    try:
+        return _run_suite(spec, request_engine, report_file, report_json_file, max_workers)
+    finally:
+        request_engine.close()
+
+
+def _run_suite(
+    spec,
+    request_engine: RequestEngine,
+    report_file: str | None,
+    report_json_file: str | None,
+    max_workers: int,
+) -> int:
     state_tracker = StateTracker(request_engine)
     invariant_checker = InvariantChecker()
     test_generator = TestGenerator()
@@ -28,64 +61,157 @@ def run(spec_path: str, report_file: str | None = None) -> int:
     fuzz_tester = FuzzTester(request_engine, state_tracker, invariant_checker)
     reporter = Reporter(use_color=True)
 
+    # All generated cases are materialized up front, before any phase starts timing requests.
+    valid_cases = {
+        name: test_generator.generate_valid_cases(endpoint)
+        for name, endpoint in spec.endpoints.items()
+        if name not in _NORMAL_SKIP_ENDPOINTS
+    }
+    sequence = test_generator.generate_stateful_sequence(spec)
+
     # Setup/reset target state first.
     reset_endpoint = spec.endpoints.get("reset")
     if reset_endpoint is not None:
-        reset_result = request_engine.send_endpoint(reset_endpoint, reset_endpoint.body)
+        reset_result = request_engine.send_prebuilt_endpoint(
+            reset_endpoint, body_bytes=request_engine.encode_body(reset_endpoint)
+        )
         reporter.add_request("setup", reset_result, sla_ms=spec.response_sla_ms)
         if reset_result.error is not None or reset_result.status_code >= 500:
             reporter.add_custom("setup", "reset_ready", False, "Target reset failed")
             reporter.print()
             return 1
 
-    _run_normal_tests(spec, request_engine, state_tracker, invariant_checker, test_generator, reporter)
+    _run_normal_tests(
+        spec,
+        request_engine,
+        state_tracker,
+        invariant_checker,
+        valid_cases,
+        reporter,
+        max_workers=max_workers,
+    )
     _run_retry_tests(spec, retry_simulator, reporter)
     _run_fuzz_tests(spec, request_engine, fuzz_tester, reporter)
-    _run_stateful_tests(spec, request_engine, state_tracker, invariant_checker, test_generator, reporter)
+    _run_stateful_tests(spec, request_engine, state_tracker, invariant_checker, sequence, reporter)
 
     reporter.print()
     if report_file:
         reporter.write(report_file)
+    if report_json_file:
+        reporter.write_json(report_json_file)
 
     return 1 if reporter.has_failures else 0
 
 
+def list_endpoints(spec_path: str) -> int:
+    try:
+        header = load_test_spec_header(spec_path)
+    except SpecValidationError as exc:
+        print(f"Spec validation failed: {exc}")
+        return 2
+
+    print(f"base_url: {header['base_url']}")
+    for name in header["endpoints"]:
+        print(f"- {name}")
+    return 0
+
+
 def _run_normal_tests(
     spec,
     request_engine: RequestEngine,
     state_tracker: StateTracker,
     invariant_checker: InvariantChecker,
-    test_generator: TestGenerator,
+    valid_cases: Dict[str, List[Dict[str, Any]]],
     reporter: Reporter,
+    max_workers: int = 1,
 ) -> None:
-    for endpoint in spec.endpoints.values():
-        if endpoint.name in {"reset", "balance"}:
-            continue
-
-        for payload in test_generator.generate_valid_cases(endpoint):
-            state_before = state_tracker.capture_state()
-            result = request_engine.send_endpoint(endpoint, payload)
-            reporter.add_request("normal", result, sla_ms=spec.response_sla_ms)
-
-            if result.error is not None:
-                reporter.add_custom(
-                    "normal",
-                    f"{endpoint.name}_executed",
-                    False,
-                    f"Request failed before invariants: {result.error}",
-                )
-                continue
-
-            state_after = state_tracker.capture_state()
-            if "balance_non_negative" in spec.invariants:
-                reporter.add_invariant(
-                    "normal", invariant_checker.check_balance_non_negative(state_after)
+    check_non_negative = "balance_non_negative" in spec.invariants
+    check_conserved = "money_conserved" in spec.invariants
+    sla_ms = spec.response_sla_ms
+    add_request = reporter.add_request
+    add_invariant = reporter.add_invariant
+
+    capture_state = state_tracker.capture_state
+    send = request_engine.send_prebuilt_endpoint
+
+    total_balance = state_tracker.total_balance
+
+    def _execute_normal_case(
+        endpoint: EndpointSpec,
+        conserves: bool,
+        payload: Dict[str, Any],
+        total_before: Optional[float] = None,
+    ) -> _NormalOutcome:
+        # Snapshots are only taken when an invariant will look at them, and each one
+        # is summed at most once.
+        if conserves and total_before is None:
+            total_before = total_balance(capture_state())
+        result = send(endpoint, payload)
+        state_after = None
+        total_after = None
+        if result.error is None and (check_non_negative or conserves):
+            state_after = capture_state()
+            if check_conserved:
+                total_after = total_balance(state_after)
+        return result, total_before, state_after, total_after
+
+    # Serial runs can hand each case's after-total to the next case as its
+    # before-total, since nothing else touches the target in between.
+    last_total: Optional[float] = None
+
+    def _execute_serially(
+        endpoint: EndpointSpec, conserves: bool, cases: List[Dict[str, Any]]
+    ) -> Iterator[_NormalOutcome]:
+        nonlocal last_total
+        for payload in cases:
+            outcome = _execute_normal_case(endpoint, conserves, payload, last_total)
+            # Without a fresh after-snapshot (error or none needed) the state is unknown.
+            last_total = outcome[3]
+            yield outcome
+
+    pool = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        for name, cases in valid_cases.items():
+            endpoint = spec.endpoints[name]
+            conserves = check_conserved and name == "transfer"
+            executed_name = f"{name}_executed"
+            if pool is None:
+                outcomes = _execute_serially(endpoint, conserves, cases)
+            else:
+                # Only cases of the same endpoint overlap, so a transfer's before/after
+                # window never contains a deposit and money_conserved stays meaningful.
+                outcomes = pool.map(
+                    functools.partial(_execute_normal_case, endpoint, conserves), cases
                 )
 
-            if endpoint.name == "transfer" and "money_conserved" in spec.invariants:
-                reporter.add_invariant(
-                    "normal", invariant_checker.check_money_conserved(state_before, state_after)
-                )
+            # Reporting stays on this thread, in case order.
+            for result, total_before, state_after, total_after in outcomes:
+                add_request("normal", result, sla_ms=sla_ms)
+
+                if result.error is not None:
+                    reporter.add_custom(
+                        "normal",
+                        executed_name,
+                        False,
+                        f"Request failed before invariants: {result.error}",
+                    )
+                    continue
+
+                if check_non_negative:
+                    add_invariant(
+                        "normal", invariant_checker.check_balance_non_negative(state_after)
+                    )
+
+                if conserves:
+                    add_invariant(
+                        "normal",
+                        invariant_checker.check_money_conserved_total(
+                            total_before, state_after, total_after=total_after
+                        ),
+                    )
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
 
 def _run_retry_tests(spec, retry_simulator: RetrySimulator, reporter: Reporter) -> None:
@@ -134,11 +260,22 @@ def _run_fuzz_tests(
 
     seed_payload = endpoint.body
     reset_endpoint = spec.endpoints.get("reset")
+    # The reset body never changes between cases; serialize it once.
+    reset_body_bytes = (
+        request_engine.encode_body(reset_endpoint) if reset_endpoint is not None else None
+    )
 
-    def _reset_before_case() -> None:
-        if reset_endpoint is None:
-            return
-        reset_result = request_engine.send_endpoint(reset_endpoint, reset_endpoint.body)
+    # Starts dirty: earlier phases have mutated the target since setup.
+    dirty = True
+
+    def _reset_before_case() -> bool:
+        nonlocal dirty
+        if reset_endpoint is None or not dirty:
+            # Returning False tells FuzzTester its last state snapshot is still valid.
+            return False
+        reset_result = request_engine.send_prebuilt_endpoint(
+            reset_endpoint, body_bytes=reset_body_bytes
+        )
         if reset_result.error is not None or reset_result.status_code >= 500:
             reporter.add_custom(
                 "fuzz",
@@ -146,11 +283,21 @@ def _run_fuzz_tests(
                 False,
                 f"Failed to reset before fuzz case: {reset_result.error or reset_result.status_code}",
             )
+        dirty = reset_result.error is not None or reset_result.status_code >= 400
+        return True
+
+    def _track_dirty(fuzz_result: FuzzCaseResult) -> None:
+        nonlocal dirty
+        # Only a cleanly rejected (4xx) case that left balances alone keeps the reset state.
+        status = fuzz_result.request_result.status_code
+        if fuzz_result.state_changed or not 400 <= status < 500:
+            dirty = True
 
     for fuzz_result in fuzz_tester.run(
         endpoint,
         seed_payload,
         before_case_hook=_reset_before_case,
+        after_case_hook=_track_dirty,
     ):
         reporter.add_fuzz_case("fuzz", fuzz_result)
 
@@ -160,16 +307,22 @@ def _run_stateful_tests(
     request_engine: RequestEngine,
     state_tracker: StateTracker,
     invariant_checker: InvariantChecker,
-    test_generator: TestGenerator,
+    sequence: List[Dict[str, Any]],
     reporter: Reporter,
 ) -> None:
-    sequence = test_generator.generate_stateful_sequence(spec)
     if not sequence:
         return
 
+    endpoints = spec.endpoints
+    sla_ms = spec.response_sla_ms
+    capture_state = state_tracker.capture_state
+    send = request_engine.send_prebuilt_endpoint
+    add_request = reporter.add_request
+    add_invariant = reporter.add_invariant
+
     for step_index, step in enumerate(sequence, start=1):
         endpoint_name = step.get("endpoint")
-        endpoint = spec.endpoints.get(endpoint_name)
+        endpoint = endpoints.get(endpoint_name)
         if endpoint is None:
             reporter.add_custom(
                 "stateful",
@@ -182,9 +335,9 @@ def _run_stateful_tests(
         payload = step.get("body")
         headers = step.get("headers")
 
-        state_before = state_tracker.capture_state()
-        result = request_engine.send_endpoint(endpoint, payload, headers=headers)
-        reporter.add_request("stateful", result, sla_ms=spec.response_sla_ms)
+        state_before = capture_state()
+        result = send(endpoint, payload, headers=headers)
+        add_request("stateful", result, sla_ms=sla_ms)
 
         if result.error is not None:
             reporter.add_custom(
@@ -195,11 +348,11 @@ def _run_stateful_tests(
             )
             continue
 
-        state_after = state_tracker.capture_state()
-        reporter.add_invariant("stateful", invariant_checker.check_balance_non_negative(state_after))
+        state_after = capture_state()
+        add_invariant("stateful", invariant_checker.check_balance_non_negative(state_after))
 
         if endpoint.name == "transfer":
-            reporter.add_invariant(
+            add_invariant(
                 "stateful", invariant_checker.check_money_conserved(state_before, state_after)
             )
 
@@ -208,7 +361,27 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Automated invariant-based API test framework")
     parser.add_argument("spec", help="Path to YAML test spec")
     parser.add_argument("--report-file", help="Optional output path for plain-text report")
+    parser.add_argument("--report-json", help="Optional output path for JSON report")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Run each endpoint's normal test cases concurrently on this many threads",
+    )
+    parser.add_argument(
+        "--list-endpoints",
+        action="store_true",
+        help="Print the spec's base URL and endpoint names, then exit",
+    )
     args = parser.parse_args()
 
-    exit_code = run(args.spec, report_file=args.report_file)
+    if args.list_endpoints:
+        sys.exit(list_endpoints(args.spec))
+
+    exit_code = run(
+        args.spec,
+        report_file=args.report_file,
+        report_json_file=args.report_json,
+        max_workers=args.workers,
+    )
     sys.exit(exit_code)
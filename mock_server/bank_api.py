@@ -1,12 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http import HTTPStatus
 from threading import Lock
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover - exercised only when orjson is missing
+    _json_loads = json.loads
+
+    def _json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional event loop
+    uvloop = None
+
 try:
     from flask import Flask, jsonify, request
 
@@ -18,6 +35,10 @@ except ImportError:  # pragma: no cover - exercised only when Flask is missing
     HAS_FLASK = False
 
 
+# Serializes writers. STATE["accounts"] is never mutated in place: writers publish a
+# fresh dict under this lock, so readers can use whatever dict they load without locking.
+# The price is an O(accounts) copy inside the lock on every write, which suits this
+# mock's handful of accounts; with many accounts, writes would contend on that copy.
 _lock = Lock()
 
 
@@ -28,15 +49,28 @@ def _env_flag(name: str, default: bool = False) -> bool:
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+# Handlers return either a mapping to serialize or an already-encoded JSON body.
+JsonPayload = Union[Dict[str, Any], bytes]
+
+_NUMERIC_TYPES = (int, float)
+
+# Bug switches are packed into one int so transfers test them with a single lookup.
+FLAG_ALLOW_NEGATIVE = 1
+FLAG_DUPLICATE_ON_RETRY = 2
+_BUG_FLAG_NAMES = (
+    (FLAG_ALLOW_NEGATIVE, "allow_negative_balance"),
+    (FLAG_DUPLICATE_ON_RETRY, "duplicate_on_retry"),
+)
+
 DEFAULT_ACCOUNTS: Dict[str, float] = {"A": 1000.0, "B": 1000.0}
 STATE: Dict[str, Any] = {
     "accounts": dict(DEFAULT_ACCOUNTS),
     "processed_idempotency_keys": {},
     "tx_counter": 0,
-    "bug_flags": {
-        "allow_negative_balance": _env_flag("BANK_BUG_ALLOW_NEGATIVE", default=False),
-        "duplicate_on_retry": _env_flag("BANK_BUG_DUPLICATE_ON_RETRY", default=False),
-    },
+    "flags": (
+        (FLAG_ALLOW_NEGATIVE if _env_flag("BANK_BUG_ALLOW_NEGATIVE", default=False) else 0)
+        | (FLAG_DUPLICATE_ON_RETRY if _env_flag("BANK_BUG_DUPLICATE_ON_RETRY", default=False) else 0)
+    ),
 }
 
 
@@ -44,13 +78,24 @@ def _handle_health() -> Tuple[int, Dict[str, Any]]:
     return 200, {"status": "ok"}
 
 
-def _handle_balance(account: Optional[str]) -> Tuple[int, Dict[str, Any]]:
-    with _lock:
-        if account:
-            if account not in STATE["accounts"]:
-                return 404, {"error": f"Account {account} not found"}
-            return 200, {"accounts": {account: STATE["accounts"][account]}}
-        return 200, {"accounts": dict(STATE["accounts"])}
+# Encoded full-balance body, paired with the accounts dict it was built from.
+_balance_body: Tuple[Optional[Dict[str, float]], bytes] = (None, b"")
+
+
+def _handle_balance(account: Optional[str]) -> Tuple[int, JsonPayload]:
+    global _balance_body
+    accounts = STATE["accounts"]
+    if account:
+        if account not in accounts:
+            return 404, {"error": f"Account {account} not found"}
+        return 200, {"accounts": {account: accounts[account]}}
+    # Writers publish a new accounts dict rather than mutating it, so the body
+    # stays valid for as long as the same dict is current.
+    cached_accounts, body = _balance_body
+    if cached_accounts is not accounts:
+        body = _json_dumps({"accounts": accounts})
+        _balance_body = (accounts, body)
+    return 200, body
 
 
 def _handle_deposit(body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
@@ -65,8 +110,9 @@ def _handle_deposit(body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
         return 400, {"error": "`amount` must be > 0"}
 
     with _lock:
-        STATE["accounts"].setdefault(account, 0.0)
-        STATE["accounts"][account] += float(amount)
+        accounts = dict(STATE["accounts"])
+        accounts[account] = accounts.get(account, 0.0) + float(amount)
+        STATE["accounts"] = accounts
         STATE["tx_counter"] += 1
         tx_id = STATE["tx_counter"]
 
@@ -74,11 +120,11 @@ def _handle_deposit(body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
             "transaction_id": tx_id,
             "account": account,
             "amount": float(amount),
-            "balance": STATE["accounts"][account],
+            "balance": accounts[account],
         }
 
 
-def _handle_transfer(body: Dict[str, Any], idempotency_key: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+def _handle_transfer(body: Dict[str, Any], idempotency_key: Optional[str]) -> Tuple[int, JsonPayload]:
     from_account = body.get("from")
     to_account = body.get("to")
     amount = body.get("amount")
@@ -98,24 +144,26 @@ def _handle_transfer(body: Dict[str, Any], idempotency_key: Optional[str]) -> Tu
         if from_account not in STATE["accounts"] or to_account not in STATE["accounts"]:
             return 404, {"error": "Account not found"}
 
-        bug_duplicate = bool(STATE["bug_flags"].get("duplicate_on_retry", False))
+        flags = STATE["flags"]
+        bug_duplicate = flags & FLAG_DUPLICATE_ON_RETRY
 
         if idempotency_key and (not bug_duplicate):
             cached = STATE["processed_idempotency_keys"].get(idempotency_key)
             if cached is not None:
-                replay = dict(cached)
-                replay["idempotent_replay"] = True
-                return 200, replay
+                return 200, cached
 
         amount_f = float(amount)
-        allow_negative = bool(STATE["bug_flags"].get("allow_negative_balance", False))
+        allow_negative = flags & FLAG_ALLOW_NEGATIVE
 
         source_balance = STATE["accounts"][from_account]
         if (not allow_negative) and source_balance < amount_f:
             return 400, {"error": "Insufficient funds"}
 
-        STATE["accounts"][from_account] -= amount_f
-        STATE["accounts"][to_account] += amount_f
+        # Both legs land in one published dict, so readers never see half a transfer.
+        accounts = dict(STATE["accounts"])
+        accounts[from_account] -= amount_f
+        accounts[to_account] += amount_f
+        STATE["accounts"] = accounts
         STATE["tx_counter"] += 1
 
         response = {
@@ -124,13 +172,16 @@ def _handle_transfer(body: Dict[str, Any], idempotency_key: Optional[str]) -> Tu
             "to": to_account,
             "amount": amount_f,
             "balances": {
-                from_account: STATE["accounts"][from_account],
-                to_account: STATE["accounts"][to_account],
+                from_account: accounts[from_account],
+                to_account: accounts[to_account],
             },
         }
 
         if idempotency_key and (not bug_duplicate):
-            STATE["processed_idempotency_keys"][idempotency_key] = dict(response)
+            # Encode the replay body once; every retry with this key reuses the bytes.
+            STATE["processed_idempotency_keys"][idempotency_key] = _json_dumps(
+                {**response, "idempotent_replay": True}
+            )
 
         return 200, response
 
@@ -139,15 +190,23 @@ def _normalize_accounts(raw_accounts: Any) -> Tuple[Optional[Dict[str, float]],
     if not isinstance(raw_accounts, dict):
         return None, "`accounts` must be a mapping"
 
-    normalized_accounts: Dict[str, float] = {}
-    for account, balance in raw_accounts.items():
-        if not isinstance(account, str):
-            return None, "Account names must be strings"
-        if not isinstance(balance, (int, float)):
-            return None, "Account balances must be numeric"
-        normalized_accounts[account] = float(balance)
-
-    return normalized_accounts, None
+    normalized_accounts = {
+        account: float(balance)
+        for account, balance in raw_accounts.items()
+        if isinstance(account, str) and isinstance(balance, _NUMERIC_TYPES)
+    }
+    if len(normalized_accounts) == len(raw_accounts):
+        return normalized_accounts, None
+
+    # Something was filtered out, so an offender exists; report the first one.
+    account, _balance = next(
+        (account, balance)
+        for account, balance in raw_accounts.items()
+        if not (isinstance(account, str) and isinstance(balance, _NUMERIC_TYPES))
+    )
+    if not isinstance(account, str):
+        return None, "Account names must be strings"
+    return None, "Account balances must be numeric"
 
 
 def _handle_reset(body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
@@ -168,41 +227,47 @@ def _handle_reset(body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
         STATE["processed_idempotency_keys"] = {}
         STATE["tx_counter"] = 0
 
-        STATE["bug_flags"]["allow_negative_balance"] = bool(
-            bug_flags.get("allow_negative_balance", STATE["bug_flags"]["allow_negative_balance"])
-        )
-        STATE["bug_flags"]["duplicate_on_retry"] = bool(
-            bug_flags.get("duplicate_on_retry", STATE["bug_flags"]["duplicate_on_retry"])
-        )
+        # Flags missing from the request keep their current setting.
+        flags = STATE["flags"]
+        for flag, flag_name in _BUG_FLAG_NAMES:
+            if flag_name in bug_flags:
+                flags = flags | flag if bug_flags[flag_name] else flags & ~flag
+        STATE["flags"] = flags
 
         return 200, {
             "status": "reset",
             "accounts": dict(STATE["accounts"]),
-            "bug_flags": dict(STATE["bug_flags"]),
+            "bug_flags": {flag_name: bool(flags & flag) for flag, flag_name in _BUG_FLAG_NAMES},
         }
 
 
 if HAS_FLASK:
     app = Flask(__name__)
 
+    def _flask_response(status: int, payload: JsonPayload) -> Any:
+        if isinstance(payload, bytes):
+            return app.response_class(payload, status=status, mimetype="application/json")
+        return jsonify(payload), status
+
+
     @app.get("/health")
     def health() -> Any:
         status, payload = _handle_health()
-        return jsonify(payload), status
+        return _flask_response(status, payload)
 
 
     @app.get("/balance")
     def get_balance() -> Any:
         account = request.args.get("account")
         status, payload = _handle_balance(account)
-        return jsonify(payload), status
+        return _flask_response(status, payload)
 
 
     @app.post("/deposit")
     def deposit() -> Any:
         body = request.get_json(silent=True) or {}
         status, payload = _handle_deposit(body)
-        return jsonify(payload), status
+        return _flask_response(status, payload)
 
 
     @app.post("/transfer")
@@ -210,79 +275,127 @@ if HAS_FLASK:
         body = request.get_json(silent=True) or {}
         key = request.headers.get("Idempotency-Key")
         status, payload = _handle_transfer(body, key)
-        return jsonify(payload), status
+        return _flask_response(status, payload)
 
 
     @app.post("/reset")
     def reset() -> Any:
         body = request.get_json(silent=True) or {}
         status, payload = _handle_reset(body)
-        return jsonify(payload), status
+        return _flask_response(status, payload)
 
 else:
     app = None
 
-    class _BankRequestHandler(BaseHTTPRequestHandler):
-        protocol_version = "HTTP/1.1"
-
-        def _read_json_body(self) -> Dict[str, Any]:
-            content_length = int(self.headers.get("Content-Length", "0") or "0")
-            if content_length <= 0:
-                return {}
-            raw = self.rfile.read(content_length)
-            if not raw:
-                return {}
-            try:
-                parsed = json.loads(raw.decode("utf-8"))
-            except json.JSONDecodeError:
-                return {}
-            return parsed if isinstance(parsed, dict) else {}
-
-        def _write_json(self, status: int, payload: Dict[str, Any]) -> None:
-            encoded = json.dumps(payload).encode("utf-8")
-            self.send_response(status)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(encoded)))
-            self.end_headers()
-            self.wfile.write(encoded)
-
-        def log_message(self, _format: str, *_args: object) -> None:
-            return
-
-        def do_GET(self) -> None:  # noqa: N802
-            parsed = urlparse(self.path)
+    def _parse_json_body(raw: bytes) -> Dict[str, Any]:
+        if not raw:
+            return {}
+        try:
+            # Both parsers take the raw bytes; no separate decode step.
+            parsed = _json_loads(raw)
+        except ValueError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def _route(
+        method: str, target: str, headers: Dict[str, str], raw_body: bytes
+    ) -> Tuple[int, JsonPayload]:
+        parsed = urlparse(target)
+        if method == "GET":
             if parsed.path == "/health":
-                status, payload = _handle_health()
-            elif parsed.path == "/balance":
+                return _handle_health()
+            if parsed.path == "/balance":
                 account = parse_qs(parsed.query).get("account", [None])[0]
-                status, payload = _handle_balance(account)
-            else:
-                status, payload = 404, {"error": "Not Found"}
-
-            self._write_json(status, payload)
-
-        def do_POST(self) -> None:  # noqa: N802
-            parsed = urlparse(self.path)
-            body = self._read_json_body()
+                return _handle_balance(account)
+            return 404, {"error": "Not Found"}
 
+        if method == "POST":
+            body = _parse_json_body(raw_body)
             if parsed.path == "/deposit":
-                status, payload = _handle_deposit(body)
-            elif parsed.path == "/transfer":
-                status, payload = _handle_transfer(body, self.headers.get("Idempotency-Key"))
-            elif parsed.path == "/reset":
-                status, payload = _handle_reset(body)
-            else:
-                status, payload = 404, {"error": "Not Found"}
-
-            self._write_json(status, payload)
+                return _handle_deposit(body)
+            if parsed.path == "/transfer":
+                return _handle_transfer(body, headers.get("idempotency-key"))
+            if parsed.path == "/reset":
+                return _handle_reset(body)
+            return 404, {"error": "Not Found"}
+
+        return 501, {"error": f"Unsupported method {method}"}
+
+    def _response_head(status: int) -> bytes:
+        return (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            "Content-Length: "
+        ).encode("latin-1")
+
+    # Everything before the Content-Length value, for the statuses handlers return.
+    _RESPONSE_HEADS = {status: _response_head(status) for status in (200, 400, 404, 501)}
+    _KEEP_ALIVE_TAIL = b"\r\nConnection: keep-alive\r\n\r\n"
+    _CLOSE_TAIL = b"\r\nConnection: close\r\n\r\n"
+
+    def _encode_response(status: int, payload: JsonPayload, keep_alive: bool) -> bytes:
+        encoded = payload if isinstance(payload, bytes) else _json_dumps(payload)
+        head = _RESPONSE_HEADS.get(status) or _response_head(status)
+        tail = _KEEP_ALIVE_TAIL if keep_alive else _CLOSE_TAIL
+        return b"".join((head, b"%d" % len(encoded), tail, encoded))
+
+    async def _handle_connection(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # One coroutine per connection, serving requests until the client closes it.
+        # Handlers are short and synchronous, so they run inline on the event loop.
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    writer.write(_encode_response(400, {"error": "Bad Request"}, False))
+                    break
+                method, target, version = parts
+
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    content_length = int(headers.get("content-length") or "0")
+                except ValueError:
+                    writer.write(_encode_response(400, {"error": "Bad Content-Length"}, False))
+                    break
+                raw_body = await reader.readexactly(content_length) if content_length > 0 else b""
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.0":
+                    keep_alive = connection == "keep-alive"
+                else:
+                    keep_alive = connection != "close"
+
+                status, payload = _route(method, target, headers, raw_body)
+                writer.write(_encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
 
+    async def _serve(host: str, port: int) -> None:
+        server = await asyncio.start_server(_handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
 
     def _run_stdlib_server(host: str, port: int) -> None:
-        server = ThreadingHTTPServer((host, port), _BankRequestHandler)
-        try:
-            server.serve_forever()
-        finally:
-            server.server_close()
+        if uvloop is not None:
+            uvloop.run(_serve(host, port))
+        else:
+            asyncio.run(_serve(host, port))
 
 
 if __name__ == "__main__":
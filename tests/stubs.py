@@ -0,0 +1,59 @@
+from typing import Any, Callable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from api_test_framework.request_engine import RequestEngine, RequestResult
+
+
+def make_result(
+    endpoint_name: str = "",
+    path: str = "/",
+    status_code: int = 200,
+    method: str = "POST",
+    body: Any = None,
+) -> RequestResult:
+    return RequestResult(
+        endpoint_name=endpoint_name,
+        method=method,
+        url=path,
+        path=path,
+        status_code=status_code,
+        body={} if body is None else body,
+        latency_ms=1.0,
+    )
+
+
+class RecordingAdapter(BaseAdapter):
+    # Transport that records every prepared request and answers with a JSON body,
+    # so a real RequestEngine can be driven without a server.
+    def __init__(
+        self, respond: Optional[Callable[[requests.PreparedRequest], int]] = None
+    ) -> None:
+        super().__init__()
+        self.respond = respond
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request: requests.PreparedRequest, **_kwargs: Any) -> requests.Response:
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = self.respond(request) if self.respond is not None else 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = b"{}"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def paths(self) -> List[str]:
+        return [urlsplit(request.url).path for request in self.requests]
+
+
+def recording_engine(
+    respond: Optional[Callable[[requests.PreparedRequest], int]] = None,
+) -> Tuple[RequestEngine, RecordingAdapter]:
+    adapter = RecordingAdapter(respond)
+    return RequestEngine("http://stub.test", adapter=adapter), adapter
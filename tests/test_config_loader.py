@@ -3,7 +3,13 @@ import textwrap
 import unittest
 from pathlib import Path
 
-from api_test_framework.config_loader import SpecValidationError, load_test_spec
+from api_test_framework.config_loader import (
+    SpecValidationError,
+    TestSpec,
+    load_test_spec,
+    load_test_spec_header,
+    load_test_spec_text,
+)
 
 
 class ConfigLoaderTests(unittest.TestCase):
@@ -17,6 +23,24 @@ class ConfigLoaderTests(unittest.TestCase):
         return path
 
     def test_load_valid_spec(self) -> None:
+        text = """
+        base_url: "http://127.0.0.1:5000"
+        endpoints:
+          transfer:
+            method: POST
+            path: /transfer
+            body:
+              from: A
+              to: B
+              amount: 100
+        """
+
+        spec = load_test_spec_text(textwrap.dedent(text))
+        self.assertEqual(spec.base_url, "http://127.0.0.1:5000")
+        self.assertIn("transfer", spec.endpoints)
+        self.assertEqual(spec.endpoints["transfer"].method, "POST")
+
+    def test_repeat_loads_return_independent_copies(self) -> None:
         path = self._write_spec(
             """
             base_url: "http://127.0.0.1:5000"
@@ -24,31 +48,61 @@ class ConfigLoaderTests(unittest.TestCase):
               transfer:
                 method: POST
                 path: /transfer
-                body:
-                  from: A
-                  to: B
-                  amount: 100
             """
         )
 
-        spec = load_test_spec(path)
-        self.assertEqual(spec.base_url, "http://127.0.0.1:5000")
-        self.assertIn("transfer", spec.endpoints)
-        self.assertEqual(spec.endpoints["transfer"].method, "POST")
+        first = load_test_spec(path)
+        first.endpoints["transfer"].body["amount"] = 1
+        second = load_test_spec(path)
+        self.assertEqual(second.endpoints["transfer"].body, {})
 
-    def test_rejects_invalid_method(self) -> None:
+    def test_reload_picks_up_file_changes(self) -> None:
         path = self._write_spec(
             """
             base_url: "http://127.0.0.1:5000"
             endpoints:
               transfer:
-                method: PATCH
+                method: POST
                 path: /transfer
             """
         )
+        self.assertEqual(load_test_spec(path).response_sla_ms, 200)
+
+        path.write_text(path.read_text(encoding="utf-8") + "response_sla_ms: 50\n", encoding="utf-8")
+        self.assertEqual(load_test_spec(path).response_sla_ms, 50)
+
+    def test_header_lists_endpoints_without_parsing_the_rest(self) -> None:
+        path = self._write_spec(
+            """
+            base_url: "http://127.0.0.1:5000/"
+            endpoints:
+              transfer:
+                method: POST
+                path: /transfer
+                body: {from: A, to: B}
+              balance:
+                method: GET
+                path: /balance
+            stateful_sequence: [
+            """
+        )
+
+        header = load_test_spec_header(path)
+        self.assertEqual(header["base_url"], "http://127.0.0.1:5000")
+        self.assertEqual(header["endpoints"], ["transfer", "balance"])
+        self.assertEqual(TestSpec.peek(path), header)
+
+    def test_rejects_invalid_method(self) -> None:
+        text = """
+        base_url: "http://127.0.0.1:5000"
+        endpoints:
+          transfer:
+            method: PATCH
+            path: /transfer
+        """
 
         with self.assertRaises(SpecValidationError):
-            load_test_spec(path)
+            load_test_spec_text(textwrap.dedent(text))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+import unittest
+from threading import Event, Lock
+from typing import Any, Dict, List, Optional
+
+from api_test_framework.config_loader import EndpointSpec
+from api_test_framework.fuzz_tester import FuzzTester
+from api_test_framework.invariant_checker import InvariantChecker
+from stubs import make_result
+from api_test_framework.request_engine import RequestResult
+
+TRANSFER = EndpointSpec(
+    name="transfer",
+    method="POST",
+    path="/transfer",
+    body={"from": "A", "to": "B", "amount": 100},
+)
+
+
+class FakeBank:
+    # Accepts only the `boundary_fraction` transfer (amount 0.001), like the mock server.
+    def __init__(self) -> None:
+        self.accounts = {"A": 1000.0, "B": 1000.0}
+        self.captures = 0
+        self._lock = Lock()
+        # When set, rejections are held back until a transfer has been accepted.
+        self.accepted = Event()
+        self.hold_rejections = False
+
+    def send_endpoint(
+        self, endpoint: EndpointSpec, payload: Optional[Dict[str, Any]] = None
+    ) -> RequestResult:
+        amount = (payload or {}).get("amount")
+        status = 400
+        if payload and payload.get("from") == "A" and amount == 0.001:
+            with self._lock:
+                self.accounts = {"A": self.accounts["A"] - amount, "B": self.accounts["B"] + amount}
+            status = 200
+            self.accepted.set()
+        elif self.hold_rejections:
+            self.accepted.wait(timeout=5)
+        return make_result(endpoint.name, endpoint.path, status)
+
+    def capture_state(self) -> Dict[str, float]:
+        with self._lock:
+            self.captures += 1
+            return dict(self.accounts)
+
+
+class FuzzTesterTests(unittest.TestCase):
+    def test_parallel_run_does_not_blame_rejected_cases_for_accepted_ones(self) -> None:
+        bank = FakeBank()
+        bank.hold_rejections = True
+        tester = FuzzTester(bank, bank, InvariantChecker, parallel=True, max_workers=8)
+
+        results = tester.run(TRANSFER, TRANSFER.body)
+
+        accepted = [r.case_name for r in results if r.request_result.status_code == 200]
+        self.assertEqual(accepted, ["boundary_fraction"])
+        failed: List[str] = [r.case_name for r in results if not r.passed]
+        self.assertEqual(failed, [])
+
+    def test_hook_returning_false_reuses_the_last_snapshot(self) -> None:
+        bank = FakeBank()
+        tester = FuzzTester(bank, bank, InvariantChecker)
+
+        results = tester.run(TRANSFER, TRANSFER.body, before_case_hook=lambda: False)
+
+        # One initial capture, then only the after-capture of each case.
+        self.assertEqual(bank.captures, 1 + len(results))
+
+    def test_hook_returning_none_or_true_forces_a_recapture(self) -> None:
+        for hook_result in (None, True):
+            bank = FakeBank()
+            tester = FuzzTester(bank, bank, InvariantChecker)
+
+            results = tester.run(TRANSFER, TRANSFER.body, before_case_hook=lambda: hook_result)
+
+            self.assertEqual(bank.captures, 2 * len(results), hook_result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,17 @@
+import random
 import unittest
 
 from api_test_framework.invariant_checker import InvariantChecker
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
 
 class InvariantCheckerTests(unittest.TestCase):
     def setUp(self) -> None:
-        self.checker = InvariantChecker()
+        self.checker = InvariantChecker
 
     def test_balance_non_negative_fails_for_negative_account(self) -> None:
         result = self.checker.check_balance_non_negative({"A": 10.0, "B": -1.0})
@@ -25,6 +31,23 @@ class InvariantCheckerTests(unittest.TestCase):
         self.assertFalse(result.passed)
         self.assertIn("delta", result.message)
 
+    def test_money_conserved_total_matches_dict_check(self) -> None:
+        before = {"A": 100.0, "B": 50.0}
+        after = {"A": 80.0, "B": 60.0}
+        result = self.checker.check_money_conserved_total(150.0, after)
+        self.assertEqual(result, self.checker.check_money_conserved(before, after))
+        self.assertFalse(result.passed)
+
+    def test_money_conserved_ignores_float_drift_on_large_states(self) -> None:
+        rng = random.Random(7)
+        for _ in range(50):
+            before = {f"acct{i}": round(rng.uniform(0, 1e6), 2) for i in range(1000)}
+            after = dict(before)
+            source, target = rng.sample(sorted(before), 2)
+            after[source] -= 0.01
+            after[target] += 0.01
+            self.assertTrue(self.checker.check_money_conserved(before, after).passed)
+
     def test_idempotent_passes_for_identical_state(self) -> None:
         result = self.checker.check_idempotent({"A": 100.0}, {"A": 100.0})
         self.assertTrue(result.passed)
@@ -34,6 +57,27 @@ class InvariantCheckerTests(unittest.TestCase):
         self.assertFalse(result.passed)
         self.assertIn("A", result.message)
 
+    def test_idempotent_reports_accounts_missing_from_either_state(self) -> None:
+        result = self.checker.check_idempotent({"A": 100.0, "B": 5.0}, {"A": 100.0, "C": 5.0})
+        self.assertFalse(result.passed)
+        self.assertIn("B: 5.00 -> 0.00; C: 0.00 -> 5.00", result.message)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class LargeStateInvariantCheckerTests(unittest.TestCase):
+    def test_large_state_uses_same_messages(self) -> None:
+        state = {f"acct{i}": float(i) for i in range(300)}
+        state["acct7"] = -3.0
+        state["acct250"] = -0.5
+        result = InvariantChecker.check_balance_non_negative(state)
+        self.assertEqual(
+            result.message, "Negative balances detected: acct250=-0.50, acct7=-3.00"
+        )
+
+    def test_large_state_without_negatives_passes(self) -> None:
+        state = {f"acct{i}": float(i) for i in range(300)}
+        self.assertTrue(InvariantChecker.check_balance_non_negative(state).passed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import main
+from api_test_framework.config_loader import EndpointSpec
+from api_test_framework.fuzz_tester import FuzzCaseResult
+from api_test_framework.invariant_checker import InvariantChecker
+from api_test_framework.reporter import Reporter
+from stubs import RecordingAdapter, make_result, recording_engine
+
+TRANSFER = EndpointSpec(name="transfer", method="POST", path="/transfer")
+RESET = EndpointSpec(name="reset", method="POST", path="/reset")
+
+
+class ScriptedFuzzTester:
+    # Plays back (status, state_changed) outcomes through the hooks FuzzTester.run calls.
+    def __init__(self, outcomes: List[Tuple[int, bool]]) -> None:
+        self.outcomes = outcomes
+        self.hook_returns: List[Optional[bool]] = []
+
+    def run(
+        self,
+        endpoint: EndpointSpec,
+        seed_payload: Any,
+        before_case_hook: Callable[[], Optional[bool]],
+        after_case_hook: Callable[[FuzzCaseResult], None],
+    ) -> List[FuzzCaseResult]:
+        results = []
+        for index, (status, state_changed) in enumerate(self.outcomes):
+            self.hook_returns.append(before_case_hook())
+            result = FuzzCaseResult(
+                case_name=f"case{index}",
+                payload={},
+                request_result=make_result(endpoint.name, endpoint.path, status),
+                state_changed=state_changed,
+                passed=True,
+                message="",
+            )
+            after_case_hook(result)
+            results.append(result)
+        return results
+
+
+class FuzzResetTests(unittest.TestCase):
+    def _run(
+        self, outcomes: List[Tuple[int, bool]]
+    ) -> Tuple[RecordingAdapter, ScriptedFuzzTester]:
+        spec = SimpleNamespace(
+            fuzz_enabled=True,
+            fuzz_endpoint="transfer",
+            endpoints={"transfer": TRANSFER, "reset": RESET},
+        )
+        engine, adapter = recording_engine()
+        self.addCleanup(engine.close)
+        fuzz_tester = ScriptedFuzzTester(outcomes)
+        main._run_fuzz_tests(spec, engine, fuzz_tester, Reporter(use_color=False))
+        return adapter, fuzz_tester
+
+    def test_reset_skipped_after_clean_rejection(self) -> None:
+        adapter, fuzz_tester = self._run([(400, False), (400, False), (422, False)])
+        # Only the first case resets: earlier phases left the target dirty.
+        self.assertEqual(fuzz_tester.hook_returns, [True, False, False])
+        self.assertEqual(adapter.paths(), ["/reset"])
+
+    def test_reset_forced_after_accepted_case(self) -> None:
+        adapter, fuzz_tester = self._run([(400, False), (200, False), (400, False)])
+        self.assertEqual(fuzz_tester.hook_returns, [True, False, True])
+        self.assertEqual(adapter.paths(), ["/reset", "/reset"])
+
+    def test_reset_forced_after_state_change(self) -> None:
+        adapter, fuzz_tester = self._run([(400, False), (400, True), (400, False)])
+        self.assertEqual(fuzz_tester.hook_returns, [True, False, True])
+        self.assertEqual(adapter.paths(), ["/reset", "/reset"])
+
+    def test_reset_forced_after_server_error(self) -> None:
+        adapter, fuzz_tester = self._run([(400, False), (500, False), (400, False)])
+        self.assertEqual(fuzz_tester.hook_returns, [True, False, True])
+        self.assertEqual(adapter.paths(), ["/reset", "/reset"])
+
+
+
+class CountingStateTracker:
+    def __init__(self) -> None:
+        self.captures = 0
+        self.totals = 0
+
+    def capture_state(self) -> Dict[str, float]:
+        self.captures += 1
+        return {"A": 1000.0, "B": 1000.0}
+
+    def total_balance(self, state: Dict[str, float]) -> float:
+        self.totals += 1
+        return sum(state.values())
+
+
+class NormalTestsTests(unittest.TestCase):
+    def test_serial_transfers_sum_each_snapshot_once(self) -> None:
+        spec = SimpleNamespace(
+            invariants=["balance_non_negative", "money_conserved"],
+            response_sla_ms=200,
+            endpoints={"transfer": TRANSFER},
+        )
+        engine, _adapter = recording_engine()
+        self.addCleanup(engine.close)
+        tracker = CountingStateTracker()
+        reporter = Reporter(use_color=False)
+
+        main._run_normal_tests(
+            spec, engine, tracker, InvariantChecker, {"transfer": [{}, {}, {}]}, reporter
+        )
+
+        # One before-snapshot, then each after-snapshot doubles as the next "before".
+        self.assertEqual((tracker.captures, tracker.totals), (4, 4))
+        self.assertFalse(reporter.has_failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from api_test_framework import reporter as reporter_module
+from api_test_framework.reporter import Reporter
+
+
+class WriteJsonTests(unittest.TestCase):
+    def _reporter(self) -> Reporter:
+        reporter = Reporter(use_color=False)
+        reporter.add_custom("setup", "reset_ready", True, "Target reset")
+        reporter.add_custom("fuzz", "fuzz_case_reset", False, "Δ balance after reset")
+        return reporter
+
+    def _write(self, reporter: Reporter) -> bytes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.json"
+            reporter.write_json(path)
+            return path.read_bytes()
+
+    def test_document_lists_summary_and_entries(self) -> None:
+        document = json.loads(self._write(self._reporter()))
+
+        self.assertEqual(document["summary"], {"passed": 1, "failed": 1, "total": 2})
+        self.assertEqual(
+            document["entries"][1],
+            {
+                "phase": "fuzz",
+                "name": "fuzz_case_reset",
+                "passed": False,
+                "message": "Δ balance after reset",
+            },
+        )
+
+    @unittest.skipIf(reporter_module.orjson is None, "orjson not installed")
+    def test_stdlib_fallback_writes_the_same_bytes(self) -> None:
+        reporter = self._reporter()
+        with_orjson = self._write(reporter)
+        with mock.patch.object(reporter_module, "orjson", None):
+            without_orjson = self._write(reporter)
+
+        self.assertEqual(without_orjson, with_orjson)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+
+import requests
+
+from api_test_framework.config_loader import EndpointSpec
+from api_test_framework.request_engine import RequestEngine
+from stubs import recording_engine
+
+TRANSFER = EndpointSpec(name="transfer", method="POST", path="/transfer")
+
+
+class EncodeBodyTests(unittest.TestCase):
+    def test_matches_requests_json_encoding(self) -> None:
+        for payload in (
+            {"from": "A", "to": "B", "amount": 1.5},
+            {"amount": 100000000000000000000},
+            {1: "non-str key"},
+        ):
+            expected = requests.Request("POST", "http://127.0.0.1/", json=payload).prepare().body
+            self.assertEqual(RequestEngine.encode_body(TRANSFER, payload), expected)
+
+    def test_get_endpoints_have_no_body(self) -> None:
+        balance = EndpointSpec(name="balance", method="GET", path="/balance")
+        self.assertIsNone(RequestEngine.encode_body(balance, {"account": "A"}))
+
+    def test_unencodable_body_becomes_request_error(self) -> None:
+        payload = {"amount": float("nan")}
+        self.assertIsNone(RequestEngine.encode_body(TRANSFER, payload))
+
+        engine = RequestEngine("http://127.0.0.1:9")
+        self.addCleanup(engine.close)
+        result = engine.send_endpoint(
+            TRANSFER, payload, body_bytes=RequestEngine.encode_body(TRANSFER, payload)
+        )
+        self.assertEqual(result.status_code, 0)
+        self.assertIn("Out of range float values", result.error)
+
+
+class BodyBytesTests(unittest.TestCase):
+    def test_caller_content_type_is_kept_and_not_duplicated(self) -> None:
+        engine, adapter = recording_engine()
+        self.addCleanup(engine.close)
+
+        engine.send_endpoint(
+            TRANSFER, body_bytes=b"{}", headers={"content-type": "application/vnd.bank+json"}
+        )
+        engine.send_endpoint(TRANSFER, body_bytes=b"{}")
+
+        custom, default = adapter.requests
+        self.assertEqual(custom.headers["Content-Type"], "application/vnd.bank+json")
+        self.assertEqual(default.headers["Content-Type"], "application/json")
+        self.assertEqual(default.body, b"{}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from typing import Dict
+
+from api_test_framework.config_loader import EndpointSpec
+from api_test_framework.invariant_checker import InvariantChecker
+from api_test_framework.retry_simulator import RetrySimulator
+from stubs import recording_engine
+
+TRANSFER = EndpointSpec(name="transfer", method="POST", path="/transfer")
+
+
+class StaticStateTracker:
+    def capture_state(self) -> Dict[str, float]:
+        return {"A": 1000.0, "B": 1000.0}
+
+
+class RetrySimulatorTests(unittest.TestCase):
+    def test_every_attempt_sends_the_same_encoded_body(self) -> None:
+        engine, adapter = recording_engine()
+        self.addCleanup(engine.close)
+        simulator = RetrySimulator(engine, StaticStateTracker(), InvariantChecker)
+
+        result = simulator.simulate(TRANSFER, {"from": "A", "to": "B", "amount": 100}, retry_count=4)
+
+        self.assertEqual(len(result.request_results), 4)
+        sent = [request.body for request in adapter.requests]
+        self.assertEqual(sent, [b'{"from": "A", "to": "B", "amount": 100}'] * 4)
+        for request in adapter.requests:
+            self.assertEqual(request.headers["Content-Type"], "application/json")
+            self.assertEqual(request.headers["Idempotency-Key"], "retry-simulation-key")
+
+
+if __name__ == "__main__":
+    unittest.main()